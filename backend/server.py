@@ -1,26 +1,103 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReplaceOne
+from pymongo.errors import DuplicateKeyError
 import os
+import asyncio
+import hashlib
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from pydantic import BaseModel, Field, ConfigDict, create_model
+from typing import List, Optional, Dict, Tuple
 import uuid
 from datetime import datetime, timezone
-import random
+import time
+import numpy as np
+import orjson
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL', '200')),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL', '20')),
+    # Fail fast under burst instead of queueing for the 30s defaults
+    waitQueueTimeoutMS=2000,
+    serverSelectionTimeoutMS=3000,
+    connectTimeoutMS=2000,
+    retryWrites=True,
+    compressors="zstd",
+)
 db = client[os.environ['DB_NAME']]
 
+
+# BSON dates decode as naive UTC datetimes; serialize them with an explicit offset
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
+# Returned directly by handlers so orjson sees the datetimes; as a mere default
+# response class FastAPI would run jsonable_encoder and stringify them first
+class UTCORJSONResponse(ORJSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+async def _drop_duplicate_states():
+    states = await db.states.find({}, {"state_code": 1, "districts": 1}).to_list(None)
+    # Keep one copy per state_code, preferring one that already embeds districts
+    states.sort(key=lambda state: not state.get("districts"))
+    seen = set()
+    duplicates = []
+    for state in states:
+        if state["state_code"] in seen:
+            duplicates.append(state["_id"])
+        seen.add(state["state_code"])
+    await db.states.delete_many({"_id": {"$in": duplicates}})
+
+
+async def _ensure_indexes():
+    try:
+        await db.states.create_index("state_code", unique=True)
+    except DuplicateKeyError:
+        # Older versions seeded without a lock, so concurrent cold requests
+        # could store every state twice
+        logger.warning("Duplicate state documents found; removing them before indexing")
+        await _drop_duplicate_states()
+        await db.states.create_index("state_code", unique=True)
+        _cache.clear()
+        _district_index.clear()
+    await asyncio.gather(
+        db.performances.create_index([("district_code", 1), ("year", -1), ("month", -1)]),
+        db.performances_latest.create_index("district_code"),
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.client = client
+    app.state.db = db
+    # Force topology discovery and the auth handshake before traffic arrives
+    await db.command("ping")
+    # Seeds an empty or legacy-layout database before the unique state_code
+    # index is built, then loads the district index before the first request
+    await _seed_if_needed()
+    await _ensure_indexes()
+    await _get_district_index()
+    yield
+    client.close()
+
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=UTCORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -31,10 +108,11 @@ class DistrictPerformance(BaseModel):
     model_config = ConfigDict(extra="ignore")
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    state_code: str
-    state_name: str
     district_code: str
-    district_name: str
+    # Not stored on performance rows; resolved from the district index on read
+    state_code: Optional[str] = None
+    state_name: Optional[str] = None
+    district_name: Optional[str] = None
     month: int
     year: int
     
@@ -64,6 +142,18 @@ class DistrictPerformance(BaseModel):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+# /performance rows as projected by its fields parameter: only id is always present
+PerformanceRow = create_model(
+    "PerformanceRow",
+    id=(str, ...),
+    **{
+        name: (Optional[field.annotation], None)
+        for name, field in DistrictPerformance.model_fields.items()
+        if name != "id"
+    },
+)
+
+
 class State(BaseModel):
     model_config = ConfigDict(extra="ignore")
     state_code: str
@@ -80,9 +170,43 @@ class District(BaseModel):
     state_name: str
 
 
-class TranslationResponse(BaseModel):
-    key: str
-    translations: Dict[str, str]
+# District as embedded in its state document
+class StateDistrict(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    district_code: str
+    district_name: str
+    district_name_hi: str  # Hindi name
+
+
+class StateWithDistricts(State):
+    districts: List[StateDistrict]
+
+
+class Bootstrap(BaseModel):
+    state: State
+    districts: List[StateDistrict]
+    district_code: Optional[str] = None
+    performances: List[PerformanceRow]  # PERFORMANCE_PROJECTION omits district_code
+
+
+# Mongo projections: fetch only what the API returns
+STATE_PROJECTION = {"_id": 0, **{f: 1 for f in State.model_fields}}
+# Districts are embedded in their state document (without the state fields)
+STATE_TREE_PROJECTION = {**STATE_PROJECTION, "districts": 1}
+# The caller already knows the district
+PERFORMANCE_PROJECTION = {"_id": 0, "district_code": 0}
+# Performance fields the dashboard reads; the default for /performance
+DASHBOARD_PERFORMANCE_FIELDS = (
+    "id", "month", "year", "state_name", "district_name",
+    "total_job_cards", "active_job_cards", "total_workers", "active_workers",
+    "person_days_generated", "average_days_per_household", "women_person_days", "sc_person_days",
+    "total_budget_allocated", "total_expenditure", "wage_expenditure", "material_expenditure",
+    "average_wage_per_day", "total_works", "completed_works", "ongoing_works",
+)
+# Upper bound for performance row limits: ten years of monthly rows
+MAX_PERFORMANCE_LIMIT = 120
+# Resolved from the district index rather than stored on performance rows
+DISTRICT_INDEX_FIELDS = frozenset({"state_code", "state_name", "district_name"})
 
 
 # Translations for UI
@@ -173,6 +297,104 @@ TRANSLATIONS = {
     }
 }
 
+# Read-only view of TRANSLATIONS, safe to share between payload builders
+TRANSLATIONS_ITEMS = tuple((k, MappingProxyType(v)) for k, v in TRANSLATIONS.items())
+
+SUPPORTED_LANGUAGES = frozenset({"en", "hi", "ta", "te", "bn"})
+
+# Language-major view of TRANSLATIONS (lang -> key -> text); missing entries
+# fall back to English here so lookups need no fallback branch
+LANG_BUNDLES: Dict[str, Dict[str, str]] = {
+    lang: {key: texts.get(lang, texts["en"]) for key, texts in TRANSLATIONS_ITEMS}
+    for lang in SUPPORTED_LANGUAGES
+}
+
+# Static endpoints are served as pre-encoded (body, etag) pairs.
+# Translations only change on deploy; Mongo-backed reference data can be reseeded.
+STATIC_CACHE_CONTROL = "public, max-age=86400"
+REFERENCE_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _encode(payload) -> Tuple[bytes, str]:
+    body = orjson.dumps(payload, option=ORJSON_OPTIONS)
+    # Weak validator: GZipMiddleware may compress the body without touching the ETag
+    return body, f'W/"{hashlib.md5(body).hexdigest()}"'
+
+
+def _json_response(
+    request: Request, encoded: Tuple[bytes, str], cache_control: str = REFERENCE_CACHE_CONTROL
+) -> Response:
+    body, etag = encoded
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match", "")
+    opaque = etag.removeprefix("W/")
+    if if_none_match.strip() == "*" or opaque in (t.strip().removeprefix("W/") for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Translation payloads never change, so serialize them once at import time
+_TRANSLATIONS_PAYLOAD = _encode({k: dict(v) for k, v in TRANSLATIONS_ITEMS})
+_LANG_PAYLOADS = {lang: _encode(bundle) for lang, bundle in LANG_BUNDLES.items()}
+
+
+# In-process cache of serialized reference data: key -> (expires_at, (body, etag))
+CACHE_TTL_SECONDS = 300
+_cache: Dict[str, Tuple[float, Tuple[bytes, str]]] = {}
+
+
+def _cache_get(key: str) -> Optional[Tuple[bytes, str]]:
+    entry = _cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def _cache_set(key: str, payload) -> Tuple[bytes, str]:
+    encoded = _encode(payload)
+    _cache[key] = (time.monotonic() + CACHE_TTL_SECONDS, encoded)
+    return encoded
+
+
+# Serializes the one-time seed so concurrent cold requests don't race on it
+_init_lock = asyncio.Lock()
+
+
+async def _seed_if_needed():
+    async with _init_lock:
+        # Empty, or seeded before districts were embedded in state documents.
+        # Checked under the lock since another request may have seeded meanwhile.
+        if await db.states.find_one({"districts": {"$exists": True}}, {"_id": 1}):
+            return
+        if await db.states.estimated_document_count():
+            logger.warning("States use the legacy layout without embedded districts; reseeding")
+        # Initialize with sample data
+        await initialize_sample_data()
+
+
+async def _find_states(projection: dict) -> List[dict]:
+    states = await db.states.find({}, projection).to_list(100)
+    if not states:
+        await _seed_if_needed()
+        states = await db.states.find({}, projection).to_list(100)
+    return states
+
+
+# district_code -> names of the district and its state, rebuilt after reseeding
+_district_index: Dict[str, dict] = {}
+
+
+async def _get_district_index() -> Dict[str, dict]:
+    if not _district_index:
+        for state in await _find_states(STATE_TREE_PROJECTION):
+            for d in state.get("districts", []):
+                _district_index[d["district_code"]] = {
+                    "state_code": state["state_code"],
+                    "state_name": state["state_name"],
+                    "district_name": d["district_name"],
+                }
+    return _district_index
+
 
 # Routes
 @api_router.get("/")
@@ -180,57 +402,160 @@ async def root():
     return {"message": "MGNREGA District Performance API", "version": "1.0"}
 
 
-@api_router.get("/states", response_model=List[State])
-async def get_states():
+@api_router.get("/states", responses={200: {"model": List[State]}})
+async def get_states(request: Request):
     """Get all states"""
-    states = await db.states.find({}, {"_id": 0}).to_list(100)
-    if not states:
-        # Initialize with sample data
-        await initialize_sample_data()
-        states = await db.states.find({}, {"_id": 0}).to_list(100)
-    return states
+    encoded = _cache_get("states")
+    if encoded is None:
+        states = await _find_states(STATE_PROJECTION)
+        encoded = _cache_set("states", states)
+    return _json_response(request, encoded)
 
 
-@api_router.get("/districts/{state_code}", response_model=List[District])
-async def get_districts(state_code: str):
+@api_router.get("/districts/{state_code}", responses={200: {"model": List[District]}})
+async def get_districts(state_code: str, request: Request):
     """Get all districts for a state"""
-    districts = await db.districts.find({"state_code": state_code}, {"_id": 0}).to_list(100)
-    if not districts:
-        raise HTTPException(status_code=404, detail="No districts found for this state")
-    return districts
-
-
-@api_router.get("/performance/{district_code}", response_model=List[DistrictPerformance])
-async def get_district_performance(district_code: str, limit: int = 12):
+    key = f"districts:{state_code}"
+    encoded = _cache_get(key)
+    if encoded is None:
+        state = await db.states.find_one({"state_code": state_code}, STATE_TREE_PROJECTION)
+        if not state or not state.get("districts"):
+            raise HTTPException(status_code=404, detail="No districts found for this state")
+        districts = [
+            {**d, "state_code": state["state_code"], "state_name": state["state_name"]}
+            for d in state["districts"]
+        ]
+        encoded = _cache_set(key, districts)
+    return _json_response(request, encoded)
+
+
+@api_router.get("/states_with_districts", responses={200: {"model": List[StateWithDistricts]}})
+async def get_states_with_districts(request: Request):
+    """Get all states with their districts embedded"""
+    encoded = _cache_get("states_with_districts")
+    if encoded is None:
+        states = await _find_states(STATE_TREE_PROJECTION)
+        encoded = _cache_set("states_with_districts", states)
+    return _json_response(request, encoded)
+
+
+@api_router.get("/performance/{district_code}", responses={200: {"model": List[PerformanceRow]}})
+async def get_district_performance(
+    district_code: str,
+    limit: int = Query(12, ge=1, le=MAX_PERFORMANCE_LIMIT),
+    fields: Optional[str] = None,
+):
     """Get performance data for a district (last N months)"""
+    requested = [f.strip() for f in fields.split(",") if f.strip()] if fields else DASHBOARD_PERFORMANCE_FIELDS
+    unknown = set(requested) - set(DistrictPerformance.model_fields)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    # id is always returned so rows stay identifiable
+    projection = {"_id": 0, "id": 1, **{f: 1 for f in requested if f not in DISTRICT_INDEX_FIELDS}}
+    
+    district = (await _get_district_index()).get(district_code)
     performances = await db.performances.find(
         {"district_code": district_code},
-        {"_id": 0}
-    ).sort("year", -1).sort("month", -1).limit(limit).to_list(limit)
+        projection
+    ).sort([("year", -1), ("month", -1)]).limit(limit).to_list(limit)
     
-    # Convert ISO string timestamps back to datetime
-    for perf in performances:
-        if isinstance(perf.get('updated_at'), str):
-            perf['updated_at'] = datetime.fromisoformat(perf['updated_at'])
+    if not district or not performances:
+        raise HTTPException(status_code=404, detail="No performance data found")
+    names = {f: district[f] for f in requested if f in DISTRICT_INDEX_FIELDS}
+    if names:
+        for perf in performances:
+            perf.update(names)
+    return UTCORJSONResponse(performances)
+
+
+@api_router.get("/latest_performance/{state_code}", responses={200: {"model": List[DistrictPerformance]}})
+async def get_latest_performance(state_code: str):
+    """Get the latest month's performance for every district in a state"""
+    index = await _get_district_index()
+    codes = [code for code, d in index.items() if d["state_code"] == state_code]
+    performances = await db.performances_latest.find(
+        {"district_code": {"$in": codes}},
+        {"_id": 0}
+    ).sort("district_code", 1).to_list(100)
     
     if not performances:
         raise HTTPException(status_code=404, detail="No performance data found")
-    return performances
-
-
-@api_router.get("/translations", response_model=List[TranslationResponse])
-async def get_translations():
+    for perf in performances:
+        perf.update(index[perf["district_code"]])
+    return UTCORJSONResponse(performances)
+
+
+@api_router.get("/bootstrap/{state_code}", responses={200: {"model": Bootstrap}})
+async def get_bootstrap(
+    state_code: str,
+    request: Request,
+    district_code: Optional[str] = None,
+    limit: int = Query(12, ge=1, le=MAX_PERFORMANCE_LIMIT),
+):
+    """Get a state, its districts and one district's recent performance in one round-trip"""
+    # Only known district/state pairs reach the cache, which keeps its key space bounded
+    if district_code is not None:
+        district = (await _get_district_index()).get(district_code)
+        if not district or district["state_code"] != state_code:
+            raise HTTPException(status_code=404, detail="District not found in this state")
+    key = f"bootstrap:{state_code}:{district_code}:{limit}"
+    encoded = _cache_get(key)
+    if encoded is None:
+        # Defaults to the state's first district when none is given
+        selected = {"$literal": district_code} if district_code else {"$arrayElemAt": ["$districts.district_code", 0]}
+        pipeline = [
+            {"$match": {"state_code": state_code}},
+            {"$project": {**STATE_TREE_PROJECTION, "district_code": selected}},
+            {"$lookup": {
+                "from": "performances",
+                "let": {"district_code": "$district_code"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$district_code", "$$district_code"]}}},
+                    {"$sort": {"year": -1, "month": -1}},
+                    {"$limit": limit},
+                    {"$project": PERFORMANCE_PROJECTION},
+                ],
+                "as": "performances",
+            }},
+        ]
+        result = await db.states.aggregate(pipeline).to_list(1)
+        if not result:
+            raise HTTPException(status_code=404, detail="State not found")
+        state = result[0]
+        encoded = _cache_set(key, {
+            "districts": state.pop("districts", []),
+            "district_code": state.pop("district_code", None),
+            "performances": state.pop("performances"),
+            "state": state,
+        })
+    return _json_response(request, encoded)
+
+
+@api_router.get("/translations", responses={200: {"model": Dict[str, Dict[str, str]]}})
+async def get_translations(request: Request):
     """Get all translations"""
-    return [TranslationResponse(key=k, translations=v) for k, v in TRANSLATIONS.items()]
+    return _json_response(request, _TRANSLATIONS_PAYLOAD, STATIC_CACHE_CONTROL)
 
 
-@api_router.get("/translations/{language}")
-async def get_language_translations(language: str):
+@api_router.get("/translations/{language}", responses={200: {"model": Dict[str, str]}})
+async def get_language_translations(language: str, request: Request):
     """Get translations for a specific language"""
-    result = {}
-    for key, translations in TRANSLATIONS.items():
-        result[key] = translations.get(language, translations["en"])
-    return result
+    if language not in SUPPORTED_LANGUAGES:
+        raise HTTPException(status_code=404, detail="Unsupported language")
+    return _json_response(request, _LANG_PAYLOADS[language], STATIC_CACHE_CONTROL)
+
+
+async def _replace_collection(collection, key: str, documents: List[dict]):
+    # Upsert by a deterministic key, then drop everything else, rather than
+    # delete+insert: concurrent seeds (e.g. several workers starting on an empty
+    # database) converge on the same contents instead of hitting duplicate keys
+    # Generated in-process, so skip server-side validation as well as ordering
+    await collection.bulk_write(
+        [ReplaceOne({key: doc[key]}, doc, upsert=True) for doc in documents],
+        ordered=False,
+        bypass_document_validation=True,
+    )
+    await collection.delete_many({key: {"$nin": [doc[key] for doc in documents]}})
 
 
 async def initialize_sample_data():
@@ -433,72 +758,103 @@ async def initialize_sample_data():
         {"district_code": "WB004", "district_name": "Siliguri", "district_name_hi": "सिलीगुड़ी", "state_code": "WB", "state_name": "West Bengal"},
     ]
     
-    # Insert states and districts
-    await db.states.delete_many({})
-    await db.districts.delete_many({})
-    await db.states.insert_many(states)
-    await db.districts.insert_many(districts)
+    # Embed each state's districts; state_code/state_name live only on the parent
+    districts_by_state = {}
+    for district in districts:
+        districts_by_state.setdefault(district["state_code"], []).append({
+            "district_code": district["district_code"],
+            "district_name": district["district_name"],
+            "district_name_hi": district["district_name_hi"],
+        })
+    for state in states:
+        state["districts"] = districts_by_state.get(state["state_code"], [])
     
     # Generate performance data for last 12 months
-    await db.performances.delete_many({})
-    performances = []
-    
     current_year = 2025
     current_month = 10
     
-    for district in districts:
-        for month_offset in range(12):
-            month = current_month - month_offset
-            year = current_year
-            
-            if month <= 0:
-                month += 12
-                year -= 1
-            
-            # Generate realistic random data
-            total_job_cards = random.randint(20000, 100000)
-            active_job_cards = int(total_job_cards * random.uniform(0.6, 0.8))
-            total_workers = int(total_job_cards * random.uniform(1.5, 2.5))
-            active_workers = int(active_job_cards * random.uniform(1.5, 2.5))
-            person_days = random.randint(100000, 500000)
-            
-            total_budget = random.uniform(5000000, 50000000)
-            expenditure = total_budget * random.uniform(0.7, 0.95)
-            
-            total_works = random.randint(200, 1000)
-            completed = int(total_works * random.uniform(0.6, 0.8))
-            
-            perf = {
-                "id": str(uuid.uuid4()),
-                "state_code": district["state_code"],
-                "state_name": district["state_name"],
-                "district_code": district["district_code"],
-                "district_name": district["district_name"],
-                "month": month,
-                "year": year,
-                "total_job_cards": total_job_cards,
-                "active_job_cards": active_job_cards,
-                "total_workers": total_workers,
-                "active_workers": active_workers,
-                "person_days_generated": person_days,
-                "average_days_per_household": round(person_days / active_job_cards, 2),
-                "women_person_days": int(person_days * random.uniform(0.45, 0.55)),
-                "sc_person_days": int(person_days * random.uniform(0.15, 0.25)),
-                "st_person_days": int(person_days * random.uniform(0.10, 0.20)),
-                "total_budget_allocated": round(total_budget, 2),
-                "total_expenditure": round(expenditure, 2),
-                "wage_expenditure": round(expenditure * 0.6, 2),
-                "material_expenditure": round(expenditure * 0.4, 2),
-                "average_wage_per_day": round(random.uniform(200, 350), 2),
-                "total_works": total_works,
-                "completed_works": completed,
-                "ongoing_works": total_works - completed,
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            }
-            performances.append(perf)
+    # Generate realistic random data for every district/month row in one batch
+    # Fixed seed keeps the sample data reproducible across reseeds
+    rng = np.random.default_rng(42)
+    n = len(districts) * 12
+    
+    # Zero-based months counted back from the current one, 12 per district
+    month_index = (current_month - 1) - np.tile(np.arange(12), len(districts))
+    
+    total_job_cards = rng.integers(20000, 100000, n, endpoint=True)
+    active_job_cards = (total_job_cards * rng.uniform(0.6, 0.8, n)).astype(np.int64)
+    total_workers = (total_job_cards * rng.uniform(1.5, 2.5, n)).astype(np.int64)
+    active_workers = (active_job_cards * rng.uniform(1.5, 2.5, n)).astype(np.int64)
+    person_days = rng.integers(100000, 500000, n, endpoint=True)
+    
+    total_budget = rng.uniform(5000000, 50000000, n)
+    expenditure = total_budget * rng.uniform(0.7, 0.95, n)
     
-    if performances:
-        await db.performances.insert_many(performances)
+    total_works = rng.integers(200, 1000, n, endpoint=True)
+    completed = (total_works * rng.uniform(0.6, 0.8, n)).astype(np.int64)
+    
+    columns = {
+        "month": month_index % 12 + 1,
+        "year": current_year + month_index // 12,
+        "total_job_cards": total_job_cards,
+        "active_job_cards": active_job_cards,
+        "total_workers": total_workers,
+        "active_workers": active_workers,
+        "person_days_generated": person_days,
+        "average_days_per_household": np.round(person_days / active_job_cards, 2),
+        "women_person_days": (person_days * rng.uniform(0.45, 0.55, n)).astype(np.int64),
+        "sc_person_days": (person_days * rng.uniform(0.15, 0.25, n)).astype(np.int64),
+        "st_person_days": (person_days * rng.uniform(0.10, 0.20, n)).astype(np.int64),
+        "total_budget_allocated": np.round(total_budget, 2),
+        "total_expenditure": np.round(expenditure, 2),
+        "wage_expenditure": np.round(expenditure * 0.6, 2),
+        "material_expenditure": np.round(expenditure * 0.4, 2),
+        "average_wage_per_day": np.round(rng.uniform(200, 350, n), 2),
+        "total_works": total_works,
+        "completed_works": completed,
+        "ongoing_works": total_works - completed,
+    }
+    # tolist() hands back native Python numbers, which BSON can encode
+    keys = list(columns)
+    rows = zip(*(column.tolist() for column in columns.values()))
+    row_districts = (district for district in districts for _ in range(12))
+    # One urandom read for every row's id instead of a uuid4() call per row
+    raw_ids = os.urandom(16 * n)
+    ids = (str(uuid.UUID(bytes=raw_ids[i:i + 16], version=4)) for i in range(0, 16 * n, 16))
+    updated_at = datetime.now(timezone.utc)
+    
+    performances = [
+        {
+            "id": perf_id,
+            "district_code": district["district_code"],
+            **dict(zip(keys, row)),
+            "updated_at": updated_at
+        }
+        for perf_id, district, row in zip(ids, row_districts, rows)
+    ]
+    # Deterministic _id so every seeding run targets the same documents
+    for perf in performances:
+        perf["_id"] = f"{perf['district_code']}:{perf['year']}:{perf['month']:02d}"
+    
+    # The collections are independent, so reseed them concurrently.
+    # The standalone districts collection is superseded by the embedded lists.
+    await asyncio.gather(
+        _replace_collection(db.states, "state_code", states),
+        _replace_collection(db.performances, "_id", performances),
+        db.districts.drop(),
+    )
+    
+    # Materialize the newest month of every district for state-level overviews
+    await db.performances.aggregate([
+        {"$sort": {"district_code": 1, "year": -1, "month": -1}},
+        {"$group": {"_id": "$district_code", "doc": {"$first": "$$ROOT"}}},
+        {"$replaceRoot": {"newRoot": "$doc"}},
+        {"$out": "performances_latest"},
+    ]).to_list(None)
+
+    # Reference data was replaced, so cached payloads are stale
+    _cache.clear()
+    _district_index.clear()
 
 
 # Include the router in the main app
@@ -511,6 +867,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
 # Configure logging
 logging.basicConfig(
@@ -518,7 +875,3 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()